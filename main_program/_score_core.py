@@ -0,0 +1,51 @@
+"""
+PXE Telemetry & Diagnostics System - Scoring kernels
+Batch health score calculation for many processed reports
+"""
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Column order of the per-component score matrix
+COMPONENTS = ('cpu', 'memory', 'disk', 'network')
+
+def _health_scores(component_scores, has_performance):
+    """Calculate health scores for an (N, 4) int32 matrix of component scores
+
+    Mirrors DiagnosticReportProcessor._calculate_health_score: the system
+    block is worth 25 points and each performance component 18.75 points,
+    scaled by its score out of 100. Rows without performance results only
+    count the system block.
+    """
+    n = component_scores.shape[0]
+    out = np.zeros(n, dtype=np.int32)
+
+    for i in range(n):
+        total_score = 25.0
+        max_score = 25.0
+
+        if has_performance[i]:
+            for j in range(component_scores.shape[1]):
+                total_score += (component_scores[i, j] / 100) * 18.75
+                max_score += 18.75
+
+        out[i] = int((total_score / max_score) * 100)
+
+    return out
+
+def _warmup():
+    """Run each kernel once so compilation (or the cache load) happens at import"""
+    health_scores(np.zeros((1, len(COMPONENTS)), dtype=np.int32), np.ones(1, dtype=np.bool_))
+
+if NUMBA_AVAILABLE:
+    # cache=True persists the compiled kernel (see NUMBA_CACHE_DIR) across
+    # restarts. fastmath is left off so scores match the Python path exactly.
+    health_scores = numba.njit(cache=True, nogil=True, error_model='numpy')(_health_scores)
+    _warmup()
+else:
+    health_scores = _health_scores
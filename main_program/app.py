@@ -6,23 +6,156 @@ Central report processing and API server
 
 import os
 import json
+import atexit
 import logging
+import logging.handlers
+import queue
 import argparse
-from datetime import datetime, timedelta
+import asyncio
+import mmap
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
+from quart import Quart, Response, request, jsonify, send_from_directory
+from quart_cors import cors
 from werkzeug.utils import secure_filename
 
+import numpy as np
+
+# Imported as main_program.app (uvicorn main_program.app:app) or as a script
+if __package__:
+    from ._score_core import NUMBA_AVAILABLE as _NUMBA_AVAILABLE, COMPONENTS, health_scores
+else:
+    from _score_core import NUMBA_AVAILABLE as _NUMBA_AVAILABLE, COMPONENTS, health_scores
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_to_json)
+except ImportError:
+    # Fall back to the stdlib parser when orjson is unavailable
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_to_json).encode('utf-8')
+
 # Configure logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format=LOG_FORMAT
 )
 logger = logging.getLogger(__name__)
 
+# Format and write this module's records on a background thread so a scan
+# hitting many bad reports is not serialized on stderr writes
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.propagate = False
+
+# How long a full scan result is trusted before the directory is re-walked
+SCAN_CACHE_TTL = 5.0
+
+# Maximum number of parsed report.json files kept in memory
+REPORT_CACHE_SIZE = 4096
+
+# smartctl line reported for a healthy disk
+SMART_PASSED = b'SMART overall-health self-assessment test result: PASSED'
+
+# Shared pool for blocking report file reads
+_io_pool = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 4),
+    thread_name_prefix='report-io'
+)
+
+# Separate, smaller pool for per-disk analysis fanout. Kept
+# apart from _io_pool so nested waits can never starve each other.
+_analysis_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='report-analysis')
+
+def _file_contains(path, needles: tuple) -> Dict[bytes, bool]:
+    """Check which byte strings occur in a file without decoding it"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be memory-mapped
+            return {n: False for n in needles}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # A memchr-backed find per needle beats any single-pass regex
+            # over the map, and keeps plain substring semantics
+            return {n: mm.find(n) != -1 for n in needles}
+
+class Analysis:
+    """Result of analyzing one performance component"""
+    
+    __slots__ = ('status', 'score', 'details')
+    
+    def __init__(self, status: str, score: int, details: Optional[Dict[str, Any]] = None):
+        self.status = status
+        self.score = score
+        self.details = details
+    
+    def to_dict(self) -> Dict[str, Any]:
+        result = {'status': self.status, 'score': self.score}
+        if self.details is not None:
+            result['details'] = self.details
+        return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Analysis':
+        return cls(data['status'], data['score'], data.get('details'))
+
+# Placeholder for components that were not tested
+_NOT_ANALYZED = Analysis('unknown', 0)
+
+def _to_json(obj: Any) -> Any:
+    """Serialize objects the JSON encoders do not handle natively"""
+    if isinstance(obj, Analysis):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# Component status by number of thresholds met (fair, then good)
+_STATUSES = ('poor', 'fair', 'good')
+
+def _classify(score: int, good: int, fair: int) -> str:
+    """Map a component score to 'good', 'fair' or 'poor'"""
+    return _STATUSES[(score >= fair) + (score >= good)]
+
+# (epoch second, formatted timestamp) of the last _utc_iso_now() call
+_now_cache = (0, '')
+
+def _utc_iso_now() -> str:
+    """Current UTC time as an ISO 8601 string, formatted at most once per second"""
+    global _now_cache
+    t = int(time.time())
+    if _now_cache[0] != t:
+        _now_cache = (t, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(t)))
+    return _now_cache[1]
+
+def _parse_timestamp(value: str) -> float:
+    """Convert an ISO 8601 report timestamp to epoch seconds (0.0 if invalid)"""
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return 0.0
+    if parsed.tzinfo is None:
+        # Reports without an offset are written in UTC
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
 class DiagnosticReportProcessor:
     """Processes and manages diagnostic reports"""
     
@@ -34,27 +167,157 @@ class DiagnosticReportProcessor:
         (self.reports_dir / "processed").mkdir(exist_ok=True)
         (self.reports_dir / "failed").mkdir(exist_ok=True)
         (self.reports_dir / "archive").mkdir(exist_ok=True)
+        
+        # Scan cache, validated against the reports directory mtime
+        self._scan_cache = None
+        self._scan_cache_mtime = 0
+        self._scan_cache_ts = 0
+        
+        # Parsed reports keyed by path, validated against report.json mtime
+        self._report_cache = OrderedDict()
+        self._report_cache_lock = threading.Lock()
     
     def scan_reports(self) -> List[Dict[str, Any]]:
         """Scan for available reports"""
-        reports = []
-        
-        for report_dir in self.reports_dir.glob("*"):
-            if report_dir.is_dir() and not report_dir.name.startswith('.'):
-                report_file = report_dir / "report.json"
-                if report_file.exists():
-                    try:
-                        with open(report_file, 'r') as f:
-                            report_data = json.load(f)
-                            report_data['_path'] = str(report_dir)
-                            report_data['_last_modified'] = report_file.stat().st_mtime
-                            reports.append(report_data)
-                    except (json.JSONDecodeError, IOError) as e:
-                        logger.warning(f"Failed to read report {report_file}: {e}")
+        return self.scan_reports_with_epochs()[0]
+    
+    def scan_reports_with_epochs(self) -> tuple:
+        """Scan for available reports, also returning their timestamps as epoch seconds
+        
+        The epochs are a numpy array aligned with the report list and are kept
+        out of the report dicts so they never reach API responses.
+        """
+        dir_mtime = self.reports_dir.stat().st_mtime_ns
+        cached = self._scan_cache
+        if (cached is not None and dir_mtime == self._scan_cache_mtime and
+                (time.monotonic() - self._scan_cache_ts) < SCAN_CACHE_TTL):
+            return cached
+        
+        candidates = []
+        
+        with os.scandir(self.reports_dir) as it:
+            for entry in it:
+                if entry.name.startswith('.') or not entry.is_dir(follow_symlinks=False):
+                    continue
+                report_path = os.path.join(entry.path, 'report.json')
+                try:
+                    st = os.stat(report_path)
+                except FileNotFoundError:
+                    continue
+                candidates.append((entry.path, report_path, st))
+        
+        # Read the report files concurrently
+        loaded = [r for r in _io_pool.map(self._read_one_report, candidates) if r is not None]
         
         # Sort by timestamp (newest first)
-        reports.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        return reports
+        loaded.sort(key=lambda x: x[0].get('timestamp', ''), reverse=True)
+        
+        reports = [report for report, _ in loaded]
+        epochs = np.fromiter((ts for _, ts in loaded), dtype=np.float64, count=len(loaded))
+        
+        self._scan_cache = (reports, epochs)
+        self._scan_cache_mtime = dir_mtime
+        self._scan_cache_ts = time.monotonic()
+        return self._scan_cache
+    
+    def _read_one_report(self, candidate: tuple) -> Optional[tuple]:
+        """Read a single report for scan_reports as (report, epoch), None on failure"""
+        report_dir, report_path, st = candidate
+        try:
+            return self._load_cached_report(report_dir, report_path, st)
+        except (ValueError, IOError) as e:
+            logger.warning("Failed to read report %s: %s", report_path, e)
+            return None
+    
+    def _load_cached_report(self, report_dir: str, report_path: str,
+                            st: os.stat_result) -> tuple:
+        """Load a report.json as (report, epoch), re-parsing only if it changed since the last scan"""
+        key = report_path
+        stamp = (st.st_mtime_ns, st.st_size)
+        
+        with self._report_cache_lock:
+            cached = self._report_cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._report_cache.move_to_end(key)
+                return cached[1], cached[2]
+        
+        with open(report_path, 'rb') as f:
+            report_data = _loads(f.read())
+        report_data['_path'] = report_dir
+        report_data['_last_modified'] = st.st_mtime
+        epoch = _parse_timestamp(report_data.get('timestamp', ''))
+        
+        with self._report_cache_lock:
+            self._report_cache[key] = (stamp, report_data, epoch)
+            self._report_cache.move_to_end(key)
+            while len(self._report_cache) > REPORT_CACHE_SIZE:
+                self._report_cache.popitem(last=False)
+        
+        return report_data, epoch
+    
+    def invalidate_cache(self, hostnames=()):
+        """Drop cached scan results and any processed results for the given hosts"""
+        self._scan_cache = None
+        
+        for hostname in hostnames:
+            try:
+                os.unlink(self.reports_dir / hostname / "processed.json.meta")
+            except OSError:
+                pass
+    
+    def _processed_key(self, report_data: Dict[str, Any]) -> Optional[List[int]]:
+        """Cache key for a report's processed results, or None if it has no report.json
+        
+        Take it before reading any of the report's inputs: results are only
+        stored if report.json still matches, so a report replaced mid-analysis
+        is never cached under the new file's key.
+        """
+        if not report_data.get('_path'):
+            return None
+        try:
+            st = os.stat(Path(report_data['_path']) / "report.json")
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+    
+    def _load_processed(self, report_data: Dict[str, Any],
+                        key: Optional[List[int]]) -> Optional[Dict[str, Any]]:
+        """Load cached processed results if they were written under the given key"""
+        if key is None:
+            return None
+        
+        report_dir = Path(report_data['_path'])
+        try:
+            if _loads((report_dir / "processed.json.meta").read_bytes()) != key:
+                return None
+            processed = _loads((report_dir / "processed.json").read_bytes())
+            
+            # Return the same shape as a fresh process_report() run
+            analysis = processed['analysis']
+            if 'performance' in analysis:
+                analysis['performance'] = {
+                    component: Analysis.from_dict(result)
+                    for component, result in analysis['performance'].items()
+                }
+            return processed
+        except (KeyError, TypeError, ValueError, IOError):
+            return None
+    
+    def _store_processed(self, report_data: Dict[str, Any], processed: Dict[str, Any],
+                         key: Optional[List[int]]):
+        """Persist processed results next to the report they were built from"""
+        # Skip if report.json changed since the key was taken
+        if key is None or self._processed_key(report_data) != key:
+            return
+        
+        report_dir = Path(report_data['_path'])
+        try:
+            for name, payload in (("processed.json", processed), ("processed.json.meta", key)):
+                tmp_path = report_dir / f".{name}.tmp"
+                tmp_path.write_bytes(_dumps(payload))
+                os.replace(tmp_path, report_dir / name)
+        except (TypeError, ValueError, IOError) as e:
+            logger.warning("Failed to cache processed report in %s: %s", report_dir, e)
     
     def get_report(self, hostname: str) -> Optional[Dict[str, Any]]:
         """Get specific report by hostname"""
@@ -65,29 +328,36 @@ class DiagnosticReportProcessor:
             return None
         
         try:
-            with open(report_file, 'r') as f:
-                report_data = json.load(f)
-                report_data['_path'] = str(report_dir)
-                return report_data
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Failed to read report {report_file}: {e}")
+            report_data = _loads(report_file.read_bytes())
+            report_data['_path'] = str(report_dir)
+            return report_data
+        except (ValueError, IOError) as e:
+            logger.error("Failed to read report %s: %s", report_file, e)
             return None
     
-    def process_report(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
+    def process_report(self, report_data: Dict[str, Any], score: bool = True) -> Dict[str, Any]:
         """Process and analyze a diagnostic report"""
+        if score:
+            key = self._processed_key(report_data)
+            cached = self._load_processed(report_data, key)
+            if cached is not None:
+                return cached
+        
         processed = {
             'hostname': report_data.get('hostname', 'unknown'),
             'timestamp': report_data.get('timestamp', ''),
-            'processed_at': datetime.utcnow().isoformat(),
+            'processed_at': _utc_iso_now(),
             'analysis': {},
             'health_score': 0,
             'issues': [],
             'recommendations': []
         }
         
+        analysis = processed['analysis']
+        
         # Analyze system information
         system_info = report_data.get('system_info', {})
-        processed['analysis']['system'] = {
+        analysis['system'] = {
             'cpu_count': system_info.get('cpu_count', 0),
             'memory_gb': system_info.get('memory_gb', 0),
             'architecture': system_info.get('architecture', 'unknown'),
@@ -97,215 +367,233 @@ class DiagnosticReportProcessor:
         # Check for performance issues
         performance_dir = Path(report_data.get('_path', '')) / "performance"
         if performance_dir.exists():
-            processed['analysis']['performance'] = self._analyze_performance(performance_dir)
+            analysis['performance'] = self._analyze_performance(performance_dir)
         
         # Calculate health score
-        processed['health_score'] = self._calculate_health_score(processed['analysis'])
+        if score:
+            processed['health_score'] = self._calculate_health_score(analysis)
         
         # Generate recommendations
-        processed['recommendations'] = self._generate_recommendations(processed['analysis'])
+        processed['recommendations'] = self._generate_recommendations(analysis)
+        
+        if score:
+            self._store_processed(report_data, processed, key)
+        
+        return processed
+    
+    def process_reports(self, reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Process and analyze many reports, scoring them in a single batch"""
+        if not _NUMBA_AVAILABLE:
+            return [self.process_report(report) for report in reports]
+        
+        processed = []
+        pending = []
+        for report in reports:
+            key = self._processed_key(report)
+            result = self._load_processed(report, key)
+            if result is None:
+                result = self.process_report(report, score=False)
+                pending.append((report, key, result))
+            processed.append(result)
+        
+        count = len(pending)
+        if count == 0:
+            return processed
+        
+        performance = [p['analysis'].get('performance') for _, _, p in pending]
+        component_scores = np.fromiter(
+            (perf[c].score if perf else 0 for perf in performance for c in COMPONENTS),
+            dtype=np.int32, count=count * len(COMPONENTS)
+        ).reshape(count, len(COMPONENTS))
+        has_performance = np.fromiter(
+            (perf is not None for perf in performance), dtype=np.bool_, count=count
+        )
+        
+        for (report, key, p), health_score in zip(pending, health_scores(component_scores, has_performance)):
+            p['health_score'] = int(health_score)
+            self._store_processed(report, p, key)
         
         return processed
     
     def _analyze_performance(self, perf_dir: Path) -> Dict[str, Any]:
         """Analyze performance test results"""
         analysis = {
-            'cpu': {'status': 'unknown', 'score': 0},
-            'memory': {'status': 'unknown', 'score': 0},
-            'disk': {'status': 'unknown', 'score': 0},
-            'network': {'status': 'unknown', 'score': 0}
+            'cpu': _NOT_ANALYZED,
+            'memory': _NOT_ANALYZED,
+            'disk': _NOT_ANALYZED,
+            'network': _NOT_ANALYZED
         }
         
+        # Enumerate the test categories in one directory scan
+        with os.scandir(perf_dir) as it:
+            existing = {e.name for e in it if e.is_dir(follow_symlinks=False)}
+        
         # Analyze CPU tests
-        cpu_dir = perf_dir / "cpu"
-        if cpu_dir.exists():
-            analysis['cpu'] = self._analyze_cpu_tests(cpu_dir)
+        if 'cpu' in existing:
+            analysis['cpu'] = self._analyze_cpu_tests(perf_dir / "cpu")
         
         # Analyze memory tests
-        mem_dir = perf_dir / "memory"
-        if mem_dir.exists():
-            analysis['memory'] = self._analyze_memory_tests(mem_dir)
+        if 'memory' in existing:
+            analysis['memory'] = self._analyze_memory_tests(perf_dir / "memory")
         
         # Analyze disk tests
-        disk_dir = perf_dir / "disk"
-        if disk_dir.exists():
-            analysis['disk'] = self._analyze_disk_tests(disk_dir)
+        if 'disk' in existing:
+            analysis['disk'] = self._analyze_disk_tests(perf_dir / "disk")
         
         # Analyze network tests
-        net_dir = perf_dir / "network"
-        if net_dir.exists():
-            analysis['network'] = self._analyze_network_tests(net_dir)
+        if 'network' in existing:
+            analysis['network'] = self._analyze_network_tests(perf_dir / "network")
         
         return analysis
     
-    def _analyze_cpu_tests(self, cpu_dir: Path) -> Dict[str, Any]:
+    def _analyze_cpu_tests(self, cpu_dir: Path) -> Analysis:
         """Analyze CPU test results"""
-        analysis = {'status': 'unknown', 'score': 0, 'details': {}}
+        score = 0
+        details = {}
         
         # Check sysbench results
         sysbench_file = cpu_dir / "sysbench_cpu.txt"
         if sysbench_file.exists():
             try:
-                with open(sysbench_file, 'r') as f:
-                    content = f.read()
-                    # Extract execution time from sysbench output
-                    if 'execution time' in content:
-                        analysis['details']['sysbench'] = 'completed'
-                        analysis['score'] += 25
-                    else:
-                        analysis['details']['sysbench'] = 'failed'
+                found = _file_contains(sysbench_file, (b'execution time',))
+                # Extract execution time from sysbench output
+                if found[b'execution time']:
+                    details['sysbench'] = 'completed'
+                    score += 25
+                else:
+                    details['sysbench'] = 'failed'
             except IOError:
-                analysis['details']['sysbench'] = 'error'
+                details['sysbench'] = 'error'
         
         # Check stress-ng results
         stress_file = cpu_dir / "stress_ng.txt"
         if stress_file.exists():
             try:
-                with open(stress_file, 'r') as f:
-                    content = f.read()
-                    if 'completed' in content:
-                        analysis['details']['stress_ng'] = 'completed'
-                        analysis['score'] += 25
-                    else:
-                        analysis['details']['stress_ng'] = 'failed'
+                found = _file_contains(stress_file, (b'completed',))
+                if found[b'completed']:
+                    details['stress_ng'] = 'completed'
+                    score += 25
+                else:
+                    details['stress_ng'] = 'failed'
             except IOError:
-                analysis['details']['stress_ng'] = 'error'
+                details['stress_ng'] = 'error'
         
         # Determine overall status
-        if analysis['score'] >= 50:
-            analysis['status'] = 'good'
-        elif analysis['score'] >= 25:
-            analysis['status'] = 'fair'
-        else:
-            analysis['status'] = 'poor'
-        
-        return analysis
+        return Analysis(_classify(score, good=50, fair=25), score, details)
     
-    def _analyze_memory_tests(self, mem_dir: Path) -> Dict[str, Any]:
+    def _analyze_memory_tests(self, mem_dir: Path) -> Analysis:
         """Analyze memory test results"""
-        analysis = {'status': 'unknown', 'score': 0, 'details': {}}
+        score = 0
+        details = {}
         
         # Check memtester results
         memtester_file = mem_dir / "memtester.txt"
         if memtester_file.exists():
             try:
-                with open(memtester_file, 'r') as f:
-                    content = f.read()
-                    if 'PASS' in content and 'FAIL' not in content:
-                        analysis['details']['memtester'] = 'passed'
-                        analysis['score'] += 50
-                    else:
-                        analysis['details']['memtester'] = 'failed'
+                found = _file_contains(memtester_file, (b'PASS', b'FAIL'))
+                if found[b'PASS'] and not found[b'FAIL']:
+                    details['memtester'] = 'passed'
+                    score += 50
+                else:
+                    details['memtester'] = 'failed'
             except IOError:
-                analysis['details']['memtester'] = 'error'
+                details['memtester'] = 'error'
         
         # Check stress-ng memory results
         stress_file = mem_dir / "stress_ng_memory.txt"
         if stress_file.exists():
             try:
-                with open(stress_file, 'r') as f:
-                    content = f.read()
-                    if 'completed' in content:
-                        analysis['details']['stress_ng'] = 'completed'
-                        analysis['score'] += 50
-                    else:
-                        analysis['details']['stress_ng'] = 'failed'
+                found = _file_contains(stress_file, (b'completed',))
+                if found[b'completed']:
+                    details['stress_ng'] = 'completed'
+                    score += 50
+                else:
+                    details['stress_ng'] = 'failed'
             except IOError:
-                analysis['details']['stress_ng'] = 'error'
+                details['stress_ng'] = 'error'
         
         # Determine overall status
-        if analysis['score'] >= 75:
-            analysis['status'] = 'good'
-        elif analysis['score'] >= 50:
-            analysis['status'] = 'fair'
-        else:
-            analysis['status'] = 'poor'
-        
-        return analysis
+        return Analysis(_classify(score, good=75, fair=50), score, details)
     
-    def _analyze_disk_tests(self, disk_dir: Path) -> Dict[str, Any]:
+    def _analyze_disk_tests(self, disk_dir: Path) -> Analysis:
         """Analyze disk test results"""
-        analysis = {'status': 'unknown', 'score': 0, 'details': {}}
+        score = 0
+        details = {}
         
         # Check each disk
-        for disk_subdir in disk_dir.iterdir():
-            if disk_subdir.is_dir():
-                disk_name = disk_subdir.name
-                analysis['details'][disk_name] = {}
-                
-                # Check SMART status
-                smart_file = disk_subdir / "smart.txt"
-                if smart_file.exists():
-                    try:
-                        with open(smart_file, 'r') as f:
-                            content = f.read()
-                            if 'SMART overall-health self-assessment test result: PASSED' in content:
-                                analysis['details'][disk_name]['smart'] = 'passed'
-                                analysis['score'] += 20
-                            else:
-                                analysis['details'][disk_name]['smart'] = 'failed'
-                    except IOError:
-                        analysis['details'][disk_name]['smart'] = 'error'
-                
-                # Check fio results
-                fio_read_file = disk_subdir / "fio_randread.txt"
-                if fio_read_file.exists():
-                    try:
-                        with open(fio_read_file, 'r') as f:
-                            content = f.read()
-                            if 'IOPS' in content:
-                                analysis['details'][disk_name]['fio_read'] = 'completed'
-                                analysis['score'] += 15
-                            else:
-                                analysis['details'][disk_name]['fio_read'] = 'failed'
-                    except IOError:
-                        analysis['details'][disk_name]['fio_read'] = 'error'
+        with os.scandir(disk_dir) as it:
+            disk_subdirs = [Path(e.path) for e in it if e.is_dir(follow_symlinks=False)]
+        
+        for disk_subdir, (disk_details, disk_score) in zip(
+                disk_subdirs, _analysis_pool.map(self._analyze_one_disk, disk_subdirs)):
+            details[disk_subdir.name] = disk_details
+            score += disk_score
         
         # Determine overall status
-        if analysis['score'] >= 50:
-            analysis['status'] = 'good'
-        elif analysis['score'] >= 25:
-            analysis['status'] = 'fair'
-        else:
-            analysis['status'] = 'poor'
+        return Analysis(_classify(score, good=50, fair=25), score, details)
+    
+    def _analyze_one_disk(self, disk_subdir: Path) -> tuple:
+        """Analyze the results for a single disk, returning (details, score)"""
+        score = 0
+        disk_details = {}
+        
+        # Check SMART status
+        smart_file = disk_subdir / "smart.txt"
+        if smart_file.exists():
+            try:
+                found = _file_contains(smart_file, (SMART_PASSED,))
+                if found[SMART_PASSED]:
+                    disk_details['smart'] = 'passed'
+                    score += 20
+                else:
+                    disk_details['smart'] = 'failed'
+            except IOError:
+                disk_details['smart'] = 'error'
         
-        return analysis
+        # Check fio results
+        fio_read_file = disk_subdir / "fio_randread.txt"
+        if fio_read_file.exists():
+            try:
+                found = _file_contains(fio_read_file, (b'IOPS',))
+                if found[b'IOPS']:
+                    disk_details['fio_read'] = 'completed'
+                    score += 15
+                else:
+                    disk_details['fio_read'] = 'failed'
+            except IOError:
+                disk_details['fio_read'] = 'error'
+        
+        return disk_details, score
     
-    def _analyze_network_tests(self, net_dir: Path) -> Dict[str, Any]:
+    def _analyze_network_tests(self, net_dir: Path) -> Analysis:
         """Analyze network test results"""
-        analysis = {'status': 'unknown', 'score': 0, 'details': {}}
+        score = 0
+        details = {}
         
         # Check iperf3 results
         iperf_file = net_dir / "iperf3_localhost.txt"
         if iperf_file.exists():
             try:
-                with open(iperf_file, 'r') as f:
-                    content = f.read()
-                    if 'receiver' in content and 'sender' in content:
-                        analysis['details']['iperf3'] = 'completed'
-                        analysis['score'] += 50
-                    else:
-                        analysis['details']['iperf3'] = 'failed'
+                found = _file_contains(iperf_file, (b'receiver', b'sender'))
+                if found[b'receiver'] and found[b'sender']:
+                    details['iperf3'] = 'completed'
+                    score += 50
+                else:
+                    details['iperf3'] = 'failed'
             except IOError:
-                analysis['details']['iperf3'] = 'error'
+                details['iperf3'] = 'error'
         
         # Check interface information
-        for iface_dir in net_dir.iterdir():
-            if iface_dir.is_dir() and iface_dir.name != 'lo':
-                ethtool_file = iface_dir / "ethtool.txt"
-                if ethtool_file.exists():
-                    analysis['details'][iface_dir.name] = 'configured'
-                    analysis['score'] += 25
+        with os.scandir(net_dir) as it:
+            for iface_dir in it:
+                if iface_dir.name == 'lo' or not iface_dir.is_dir(follow_symlinks=False):
+                    continue
+                if os.path.exists(os.path.join(iface_dir.path, "ethtool.txt")):
+                    details[iface_dir.name] = 'configured'
+                    score += 25
         
         # Determine overall status
-        if analysis['score'] >= 75:
-            analysis['status'] = 'good'
-        elif analysis['score'] >= 50:
-            analysis['status'] = 'fair'
-        else:
-            analysis['status'] = 'poor'
-        
-        return analysis
+        return Analysis(_classify(score, good=75, fair=50), score, details)
     
     def _calculate_health_score(self, analysis: Dict[str, Any]) -> int:
         """Calculate overall health score"""
@@ -321,7 +609,7 @@ class DiagnosticReportProcessor:
         performance = analysis.get('performance', {})
         for component in ['cpu', 'memory', 'disk', 'network']:
             if component in performance:
-                score = performance[component].get('score', 0)
+                score = performance[component].score
                 max_possible = 100
                 total_score += (score / max_possible) * 18.75  # 75/4 = 18.75 per component
                 max_score += 18.75
@@ -338,23 +626,23 @@ class DiagnosticReportProcessor:
         performance = analysis.get('performance', {})
         
         # CPU recommendations
-        cpu = performance.get('cpu', {})
-        if cpu.get('status') == 'poor':
+        cpu = performance.get('cpu', _NOT_ANALYZED)
+        if cpu.status == 'poor':
             recommendations.append("CPU performance is poor. Consider checking for thermal throttling or background processes.")
         
         # Memory recommendations
-        memory = performance.get('memory', {})
-        if memory.get('status') == 'poor':
+        memory = performance.get('memory', _NOT_ANALYZED)
+        if memory.status == 'poor':
             recommendations.append("Memory tests failed. Check for faulty RAM modules or memory configuration.")
         
         # Disk recommendations
-        disk = performance.get('disk', {})
-        if disk.get('status') == 'poor':
+        disk = performance.get('disk', _NOT_ANALYZED)
+        if disk.status == 'poor':
             recommendations.append("Disk performance is poor. Check SMART status and consider replacing failing drives.")
         
         # Network recommendations
-        network = performance.get('network', {})
-        if network.get('status') == 'poor':
+        network = performance.get('network', _NOT_ANALYZED)
+        if network.status == 'poor':
             recommendations.append("Network performance is poor. Check cable connections and switch configuration.")
         
         # General recommendations
@@ -363,86 +651,157 @@ class DiagnosticReportProcessor:
         
         return recommendations
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app)
+def _safe_extract(tar: tarfile.TarFile, member: tarfile.TarInfo, dest_dir: Path):
+    """Extract one archive member, refusing anything that lands outside dest_dir"""
+    root = os.path.realpath(dest_dir)
+    target = os.path.realpath(os.path.join(root, member.name))
+    if os.path.commonpath([root, target]) != root:
+        raise ValueError(f"Archive member escapes the reports directory: {member.name}")
+    if not (member.isfile() or member.isdir()):
+        raise ValueError(f"Unsupported archive member type: {member.name}")
+    
+    # The 'data' filter also drops ownership and setuid/setgid bits
+    tar.extract(member, path=root, filter='data')
+
+def _extract_archive(stream, dest_dir: Path, extracted: set):
+    """Extract an uploaded report archive straight from its upload stream
+
+    Members are unpacked into a hidden staging directory under dest_dir and
+    the top-level entries are only moved into place once the whole archive
+    has been accepted, so a rejected upload leaves dest_dir untouched. An
+    uploaded host directory replaces the existing one. Entries moved into
+    place are added to ``extracted``.
+    """
+    staging = Path(tempfile.mkdtemp(prefix='.upload-', dir=dest_dir))
+    incoming = staging / "new"
+    retired = staging / "old"
+    try:
+        incoming.mkdir()
+        retired.mkdir()
+        
+        with tarfile.open(fileobj=stream, mode='r|gz') as tar:
+            for member in tar:
+                _safe_extract(tar, member, incoming)
+        
+        for name in os.listdir(incoming):
+            target = dest_dir / name
+            if os.path.lexists(target):
+                os.replace(target, retired / name)
+            os.replace(incoming / name, target)
+            extracted.add(name)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+async def _stream_reports(reports: List[Dict[str, Any]]):
+    """Yield the report list response one serialized report at a time"""
+    yield b'{"status":"success","count":%d,"reports":[' % len(reports)
+    for i, report in enumerate(reports):
+        yield (b',' if i else b'') + _dumps(report)
+    yield b']}'
+
+def _json_response(payload: Dict[str, Any], status: int = 200) -> Response:
+    """Serialize a (potentially large) payload with orjson"""
+    return Response(_dumps(payload), status=status, mimetype='application/json')
+
+# Initialize Quart app
+app = Quart(__name__)
+# Report archives with hardware dumps and test logs exceed Quart's 16 MB /
+# 60 s body defaults; keep Flask's behaviour of no limit on either
+app.config['MAX_CONTENT_LENGTH'] = None
+app.config['BODY_TIMEOUT'] = None
+app = cors(app)
 
-# Initialize report processor
-processor = DiagnosticReportProcessor()
+# Initialize report processor (server workers pick up --reports-dir from the environment)
+processor = DiagnosticReportProcessor(os.environ.get('PXE_REPORTS_DIR', '/var/lib/foreman-reports'))
 
 @app.route('/api/v1/reports', methods=['GET'])
-def list_reports():
+async def list_reports():
     """List all available reports"""
     try:
-        reports = processor.scan_reports()
-        return jsonify({
-            'status': 'success',
-            'count': len(reports),
-            'reports': reports
-        })
+        reports = await asyncio.to_thread(processor.scan_reports)
+        return Response(_stream_reports(reports), mimetype='application/json')
     except Exception as e:
-        logger.error(f"Failed to list reports: {e}")
+        logger.error("Failed to list reports: %s", e)
         return jsonify({
             'status': 'error',
             'message': str(e)
         }), 500
 
 @app.route('/api/v1/reports/<hostname>', methods=['GET'])
-def get_report(hostname):
+async def get_report(hostname):
     """Get specific report by hostname"""
     try:
-        report = processor.get_report(hostname)
+        report = await asyncio.to_thread(processor.get_report, hostname)
         if report is None:
             return jsonify({
                 'status': 'error',
                 'message': f'Report not found for hostname: {hostname}'
             }), 404
         
-        return jsonify({
+        return _json_response({
             'status': 'success',
             'report': report
         })
     except Exception as e:
-        logger.error(f"Failed to get report for {hostname}: {e}")
+        logger.error("Failed to get report for %s: %s", hostname, e)
         return jsonify({
             'status': 'error',
             'message': str(e)
         }), 500
 
 @app.route('/api/v1/reports/<hostname>/analyze', methods=['GET'])
-def analyze_report(hostname):
+async def analyze_report(hostname):
     """Analyze and process a specific report"""
     try:
-        report = processor.get_report(hostname)
+        report = await asyncio.to_thread(processor.get_report, hostname)
         if report is None:
             return jsonify({
                 'status': 'error',
                 'message': f'Report not found for hostname: {hostname}'
             }), 404
         
-        analysis = processor.process_report(report)
-        return jsonify({
+        analysis = await asyncio.to_thread(processor.process_report, report)
+        return _json_response({
             'status': 'success',
             'analysis': analysis
         })
     except Exception as e:
-        logger.error(f"Failed to analyze report for {hostname}: {e}")
+        logger.error("Failed to analyze report for %s: %s", hostname, e)
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/v1/analyze', methods=['GET'])
+async def analyze_all_reports():
+    """Analyze and process every available report"""
+    try:
+        reports = await asyncio.to_thread(processor.scan_reports)
+        analyses = await asyncio.to_thread(processor.process_reports, reports)
+        return _json_response({
+            'status': 'success',
+            'count': len(analyses),
+            'analyses': analyses
+        })
+    except Exception as e:
+        logger.error("Failed to analyze reports: %s", e)
         return jsonify({
             'status': 'error',
             'message': str(e)
         }), 500
 
 @app.route('/api/v1/reports/upload', methods=['POST'])
-def upload_report():
+async def upload_report():
     """Upload a new diagnostic report"""
     try:
-        if 'file' not in request.files:
+        files = await request.files
+        if 'file' not in files:
             return jsonify({
                 'status': 'error',
                 'message': 'No file provided'
             }), 400
         
-        file = request.files['file']
+        file = files['file']
         if file.filename == '':
             return jsonify({
                 'status': 'error',
@@ -451,17 +810,19 @@ def upload_report():
         
         if file and file.filename.endswith('.tar.gz'):
             filename = secure_filename(file.filename)
-            filepath = processor.reports_dir / filename
-            
-            file.save(str(filepath))
             
             # Extract the report
-            import tarfile
-            with tarfile.open(filepath, 'r:gz') as tar:
-                tar.extractall(path=processor.reports_dir)
-            
-            # Remove the uploaded archive
-            filepath.unlink()
+            extracted = set()
+            try:
+                await asyncio.to_thread(_extract_archive, file.stream, processor.reports_dir, extracted)
+            except (tarfile.TarError, ValueError) as e:
+                logger.error("Rejected report archive %s: %s", filename, e)
+                return jsonify({
+                    'status': 'error',
+                    'message': f'Invalid report archive: {e}'
+                }), 400
+            finally:
+                processor.invalidate_cache(extracted)
             
             return jsonify({
                 'status': 'success',
@@ -474,38 +835,35 @@ def upload_report():
             }), 400
     
     except Exception as e:
-        logger.error(f"Failed to upload report: {e}")
+        logger.error("Failed to upload report: %s", e)
         return jsonify({
             'status': 'error',
             'message': str(e)
         }), 500
 
 @app.route('/api/v1/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': _utc_iso_now(),
         'service': 'PXE Diagnostic Main Program'
     })
 
 @app.route('/api/v1/stats', methods=['GET'])
-def get_stats():
+async def get_stats():
     """Get system statistics"""
     try:
-        reports = processor.scan_reports()
+        reports, epochs = await asyncio.to_thread(processor.scan_reports_with_epochs)
         
         # Calculate statistics
         total_reports = len(reports)
-        recent_reports = len([r for r in reports if 
-                            datetime.fromisoformat(r.get('timestamp', '1970-01-01T00:00:00').replace('Z', '+00:00')) > 
-                            datetime.utcnow() - timedelta(days=7)])
+        recent_reports = int((epochs > (time.time() - 7 * 86400)).sum())
         
         # Count by status
-        status_counts = {}
-        for report in reports:
-            status = report.get('test_results', {}).get('overall', 'unknown')
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = dict(Counter(
+            r.get('test_results', {}).get('overall', 'unknown') for r in reports
+        ))
         
         return jsonify({
             'status': 'success',
@@ -517,7 +875,7 @@ def get_stats():
             }
         })
     except Exception as e:
-        logger.error(f"Failed to get stats: {e}")
+        logger.error("Failed to get stats: %s", e)
         return jsonify({
             'status': 'error',
             'message': str(e)
@@ -527,19 +885,38 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='PXE Diagnostic Main Program')
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to')
     parser.add_argument('--port', type=int, default=5000, help='Port to bind to')
-    parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--debug', action='store_true', help='Enable debug mode (development server)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Number of server worker processes')
     parser.add_argument('--reports-dir', default='/var/lib/foreman-reports', help='Reports directory')
     
     args = parser.parse_args()
     
     # Update processor with custom reports directory
+    os.environ['PXE_REPORTS_DIR'] = args.reports_dir
     processor = DiagnosticReportProcessor(args.reports_dir)
     
-    logger.info(f"Starting PXE Diagnostic Main Program on {args.host}:{args.port}")
-    logger.info(f"Reports directory: {args.reports_dir}")
+    logger.info("Starting PXE Diagnostic Main Program on %s:%s", args.host, args.port)
+    logger.info("Reports directory: %s", args.reports_dir)
+    if _NUMBA_AVAILABLE:
+        logger.info("Numba kernel cache: %s", os.environ.get('NUMBA_CACHE_DIR', '__pycache__ next to _score_core.py'))
+    else:
+        logger.info("Numba not available, using the pure Python scoring path")
     
-    app.run(
-        host=args.host,
-        port=args.port,
-        debug=args.debug
-    )
+    if args.debug:
+        logger.info("Server: Quart development server (debug)")
+        app.run(
+            host=args.host,
+            port=args.port,
+            debug=args.debug
+        )
+    else:
+        import uvicorn
+        
+        logger.info("Server: uvicorn with %d worker(s)", args.workers)
+        uvicorn.run(
+            'app:app',
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            app_dir=os.path.dirname(os.path.abspath(__file__))
+        )